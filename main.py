@@ -1,18 +1,50 @@
 import os
+import sys
 import logging
-import traceback
-import yaml
 import json
-import argparse
-from slack_bolt import App
-from slack_bolt.adapter.socket_mode import SocketModeHandler
-from claude_code_sdk import (
-    query,
-    ClaudeCodeOptions,
-    AssistantMessage,
-    TextBlock,
-    ToolUseBlock,
-)
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+# Heavy third-party modules (slack_bolt, claude_code_sdk, yaml) are imported
+# lazily inside the functions that need them so that e.g. `--help` does not
+# pay their full import cost.
+
+# Swallow records emitted before setup_logging() configures handlers
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Resolved once at import; load_config() and its JSON cache use these
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml")
+CONFIG_CACHE_PATH = CONFIG_PATH + ".cache.json"
+
+# Bot mention format: <@USER_ID> (compiled once; stripped on every mention)
+_MENTION_RE = re.compile(r"<@[A-Z0-9]+>")
+
+# Reusable encoder for tool-use input; orjson's C encoder when available
+# (install the optional "speedups" group), stdlib otherwise
+try:
+    import orjson
+
+    def _encode_tool_input(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _encode_tool_input = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+
+class _Lazy:
+    """
+    Defer computing a log argument until a handler actually formats it.
+
+    Wraps a zero-argument callable; str() invokes it. Suppressed log
+    records never pay for rendering the value.
+    """
+
+    def __init__(self, fn):
+        self._fn = fn
+
+    def __str__(self):
+        return str(self._fn())
 
 
 class ClaudeSlackApp:
@@ -28,6 +60,11 @@ class ClaudeSlackApp:
         Args:
             config (dict): Configuration dictionary loaded from YAML file
         """
+        from slack_bolt.async_app import AsyncApp
+        from slack_bolt.adapter.socket_mode.aiohttp import AsyncSocketModeHandler
+        from slack_sdk.web.async_client import AsyncWebClient
+        from claude_code_sdk import ClaudeCodeOptions, TextBlock, ToolUseBlock
+
         self.config = config
         self.logger = logging.getLogger(__name__)
 
@@ -36,7 +73,7 @@ class ClaudeSlackApp:
         # Initialize Claude Code SDK options
         bot_config = config.get("bot", {})
 
-        self.logger.info(f"Configurations: {bot_config}")
+        self.logger.info("Configurations: %s", bot_config)
         self.claude_options = ClaudeCodeOptions(
             system_prompt=bot_config.get(
                 "system_prompt", "You are a helpful Slack bot."
@@ -48,9 +85,26 @@ class ClaudeSlackApp:
 
         self.output_tool_use = bot_config.get("output_tool_use", False)
 
-        # Initialize Slack Bolt app
+        # O(1) dispatch on the exact block type instead of chained
+        # isinstance checks per streamed block; whether tool-use blocks
+        # are rendered is decided once here
+        self._block_dispatch = {TextBlock: self._append_text_block}
+        if self.output_tool_use:
+            self._block_dispatch[ToolUseBlock] = self._append_tool_use_block
+
+        # Bind user-facing messages once; missing keys fail here at startup
+        # instead of mid-conversation, and handlers skip the dict lookups
+        messages = config["messages"]
+        self._msg_empty = messages["empty_message"]
+        self._msg_processing = messages["processing_message"]
+        self._msg_error = messages["general_error"]
+        self._msg_long = messages["long_response_error"]
+        self._msg_empty_resp = messages["empty_response"]
+
+        # Initialize Slack Bolt app (async, so Claude SDK streaming and
+        # Slack API calls share one event loop without sync/async bridging)
         slack_config = config["slack"]
-        self.app = App(
+        self.app = AsyncApp(
             token=slack_config["bot_token"],
             signing_secret=slack_config["signing_secret"],
         )
@@ -60,82 +114,85 @@ class ClaudeSlackApp:
         self.app.event("message")(self.handle_message)
 
         # Initialize Socket Mode handler
-        self.handler = SocketModeHandler(self.app, slack_config["app_token"])
+        self.handler = AsyncSocketModeHandler(self.app, slack_config["app_token"])
+
+        # Shared Web API client for background updates. A persistent HTTP
+        # session is attached in start() so keep-alive spans chat_update
+        # calls, and the explicit timeout ensures a hung Slack call cannot
+        # stall a task indefinitely
+        self.web = AsyncWebClient(token=slack_config["bot_token"], timeout=30)
 
-    def handle_mention(self, event, say, client):
+        # Background Claude tasks; keep references so they are not
+        # garbage-collected mid-flight
+        self._tasks = set()
+
+        # Events currently being processed, so Slack retries of the same
+        # event do not trigger a second Claude invocation
+        self._inflight = OrderedDict()
+
+    async def handle_mention(self, event, say):
         """
         Handle app mention events.
 
         Args:
             event: Slack event object
             say: Function to send response
-            client: Slack Web API client
         """
+        event_key = None
         try:
-            self.logger.info(f"Received mention: {event}")
+            # Only render the fields useful for debugging, and only when a
+            # log handler will actually emit the record (events can be large)
+            self.logger.info(
+                "Received mention: %s",
+                _Lazy(lambda: {k: event.get(k) for k in ("channel", "user", "ts")}),
+            )
 
-            # Extract user content by removing bot mention
-            user_content = event["text"]
-            # Remove bot mention (format: <@USER_ID>)
-            import re
+            # Skip retries of events we are already processing
+            event_key = (event["channel"], event.get("event_ts") or event["ts"])
+            if not self._mark_inflight(event_key):
+                self.logger.info("Duplicate event, skipping: %s", event_key)
+                return
 
-            user_content = re.sub(r"<@[A-Z0-9]+>", "", user_content).strip()
+            # Extract user content by removing bot mention
+            user_content = _MENTION_RE.sub("", event["text"]).strip()
 
             if not user_content:
-                say(
-                    text=self.config["messages"]["empty_message"], thread_ts=event["ts"]
-                )
+                self._inflight.pop(event_key, None)
+                await say(text=self._msg_empty, thread_ts=event["ts"])
                 return
 
             # Send immediate "processing" response
-            processing_response = say(
-                text=self.config["messages"]["processing_message"],
+            processing_response = await say(
+                text=self._msg_processing,
                 thread_ts=event["ts"],
             )
 
             # Get the timestamp of the message we just sent
             processing_ts = processing_response["ts"]
 
-            try:
-                # Process with Claude
-                response_text = self._process_with_claude(user_content)
-
-                # Update the processing message with the actual response
-                client.chat_update(
-                    channel=event["channel"],
-                    ts=processing_ts,
-                    text=response_text,  # Fallback text
-                    blocks=[
-                        {
-                            "type": "section",
-                            "text": {"type": "mrkdwn", "text": response_text},
-                        }
-                    ],
-                )
-
-            except Exception as claude_error:
-                self.logger.error(f"Error processing with Claude: {claude_error}")
-                # Update with error message
-                client.chat_update(
-                    channel=event["channel"],
-                    ts=processing_ts,
-                    text=self.config["messages"]["general_error"],
-                )
+            # Hand the Claude round-trip off to a background task so the
+            # handler returns before Slack's retry deadline
+            self._spawn_claude_task(
+                user_content, event["channel"], processing_ts, event_key
+            )
 
-        except Exception as e:
-            self.logger.error(f"Error in handle_mention: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            say(text=self.config["messages"]["general_error"], thread_ts=event["ts"])
+        except Exception:
+            self.logger.exception("Error in handle_mention")
+            # The event was never handed off to a Claude task, so let a
+            # Slack retry of it be processed instead of dropped
+            if event_key is not None:
+                self._inflight.pop(event_key, None)
+            await say(text=self._msg_error, thread_ts=event["ts"])
 
-    def handle_message(self, event, say, client):
+    async def handle_message(self, event, say):
         """
         Handle direct message events.
 
         Args:
             event: Slack event object
             say: Function to send response
-            client: Slack Web API client
         """
+        event_key = None
         try:
             # Only handle direct messages, ignore channel messages and bot messages
             if (
@@ -143,47 +200,131 @@ class ClaudeSlackApp:
                 and event.get("subtype") != "bot_message"
                 and "bot_id" not in event
             ):
-                self.logger.info(f"Received DM: {event}")
+                # Only render the fields useful for debugging, and only when
+                # a log handler will actually emit the record
+                self.logger.info(
+                    "Received DM: %s",
+                    _Lazy(lambda: {k: event.get(k) for k in ("channel", "user", "ts")}),
+                )
+
+                # Skip retries of events we are already processing
+                event_key = (event["channel"], event.get("event_ts") or event["ts"])
+                if not self._mark_inflight(event_key):
+                    self.logger.info("Duplicate event, skipping: %s", event_key)
+                    return
 
                 user_content = event["text"].strip()
                 if not user_content:
-                    say(self.config["messages"]["empty_message"])
+                    self._inflight.pop(event_key, None)
+                    await say(self._msg_empty)
                     return
 
                 # Send immediate "processing" response
-                processing_response = say(self.config["messages"]["processing_message"])
+                processing_response = await say(self._msg_processing)
                 processing_ts = processing_response["ts"]
 
-                try:
-                    # Process with Claude
-                    response_text = self._process_with_claude(user_content)
-
-                    # Update the processing message with the actual response
-                    client.chat_update(
-                        channel=event["channel"],
-                        ts=processing_ts,
-                        text=response_text,  # Fallback text
-                        blocks=[
-                            {
-                                "type": "section",
-                                "text": {"type": "mrkdwn", "text": response_text},
-                            }
-                        ],
-                    )
-
-                except Exception as claude_error:
-                    self.logger.error(f"Error processing with Claude: {claude_error}")
-                    # Update with error message
-                    client.chat_update(
-                        channel=event["channel"],
-                        ts=processing_ts,
-                        text=self.config["messages"]["general_error"],
-                    )
-
-        except Exception as e:
-            self.logger.error(f"Error in handle_message: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            say(self.config["messages"]["general_error"])
+                # Hand the Claude round-trip off to a background task so the
+                # handler returns before Slack's retry deadline
+                self._spawn_claude_task(
+                    user_content, event["channel"], processing_ts, event_key
+                )
+
+        except Exception:
+            self.logger.exception("Error in handle_message")
+            # The event was never handed off to a Claude task, so let a
+            # Slack retry of it be processed instead of dropped
+            if event_key is not None:
+                self._inflight.pop(event_key, None)
+            await say(self._msg_error)
+
+    # Upper bound on remembered event keys; keys from events that never
+    # reach the Claude stage are evicted oldest-first instead of leaking
+    _INFLIGHT_MAX = 10000
+
+    def _mark_inflight(self, event_key):
+        """
+        Atomically mark an event as being processed.
+
+        All handlers run on the single event loop thread, so a plain
+        check-and-add without locking is race-free here.
+
+        Args:
+            event_key (tuple): (channel, event_ts) identifying the event
+
+        Returns:
+            bool: False if the event is already in flight
+        """
+        if event_key in self._inflight:
+            return False
+        self._inflight[event_key] = True
+        while len(self._inflight) > self._INFLIGHT_MAX:
+            self._inflight.popitem(last=False)
+        return True
+
+    def _spawn_claude_task(self, user_content, channel, processing_ts, event_key):
+        """
+        Schedule Claude processing as a background task on the event loop.
+
+        Args:
+            user_content (str): User's message content
+            channel (str): Channel ID of the placeholder message
+            processing_ts (str): Timestamp of the placeholder message
+            event_key (tuple): In-flight key to evict once processing ends
+        """
+        import asyncio
+
+        task = asyncio.create_task(
+            self._run_claude_and_update(user_content, channel, processing_ts, event_key)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_claude_and_update(
+        self, user_content, channel, processing_ts, event_key
+    ):
+        """
+        Process a message with Claude and update the placeholder message.
+
+        Runs as a background task so that event handlers can return
+        immediately after posting the "processing" message. Updates go
+        through the shared Web API client.
+
+        Args:
+            user_content (str): User's message content
+            channel (str): Channel ID of the placeholder message
+            processing_ts (str): Timestamp of the placeholder message
+            event_key (tuple): In-flight key to evict once processing ends
+        """
+        try:
+            # Process with Claude, streaming partial output into the
+            # placeholder message as it arrives
+            response_text = await self._process_with_claude(
+                user_content, channel, processing_ts, self.web
+            )
+
+            # Update the processing message with the actual response
+            await self.web.chat_update(
+                channel=channel,
+                ts=processing_ts,
+                text=response_text,  # Fallback text
+                blocks=[
+                    {
+                        "type": "section",
+                        "text": {"type": "mrkdwn", "text": response_text},
+                    }
+                ],
+            )
+
+        except Exception as claude_error:
+            self.logger.error("Error processing with Claude: %s", claude_error)
+            # Update with error message
+            await self.web.chat_update(
+                channel=channel,
+                ts=processing_ts,
+                text=self._msg_error,
+            )
+        finally:
+            self._inflight.pop(event_key, None)
 
     def _convert_to_slack_format(self, text):
         """
@@ -195,8 +336,6 @@ class ClaudeSlackApp:
         Returns:
             str: Text formatted for Slack mrkdwn
         """
-        import re
-
         # Convert markdown bold (**text**) to Slack format (*text*)
         text = re.sub(r"\*\*(.*?)\*\*", r"*\1*", text)
 
@@ -205,83 +344,172 @@ class ClaudeSlackApp:
 
         return text
 
-    def _process_with_claude(self, user_content):
+    def _append_text_block(self, block, responses):
+        """
+        Append a text block's content to the response fragments.
+
+        Fragments are converted to Slack mrkdwn here so the running length
+        counter measures exactly what will be sent. The bold pattern never
+        matches across newlines, so converting per fragment is equivalent
+        to converting the joined text.
+
+        Args:
+            block: Claude TextBlock
+            responses (list): Response fragments collected so far
+
+        Returns:
+            int: Characters added, including the newline separator
+        """
+        text = self._convert_to_slack_format(block.text)
+        responses.append(text)
+        return len(text) + 1
+
+    def _append_tool_use_block(self, block, responses):
+        """
+        Append a rendered tool-use block to the response fragments.
+
+        Converted to Slack mrkdwn on append, like _append_text_block.
+
+        Args:
+            block: Claude ToolUseBlock
+            responses (list): Response fragments collected so far
+
+        Returns:
+            int: Characters added, including the newline separators
+        """
+        if block.name == "Bash":
+            rendered = f"```\n$ {block.input['command']} # {block.input.get('description')}\n```"
+        else:
+            rendered = f"```\n{_encode_tool_input(block.input)}\n```"
+        responses.append(f"*{block.name}*")
+        responses.append(self._convert_to_slack_format(rendered))
+        return len(responses[-2]) + len(responses[-1]) + 2
+
+    # Minimum interval between partial chat_update calls (Slack allows
+    # roughly one message update per second)
+    _STREAM_UPDATE_INTERVAL = 0.75
+
+    # Longest prompt forwarded to Claude; Slack messages can be up to 40k
+    # characters and everything sent is processed and billed
+    _MAX_PROMPT_CHARS = 8000
+
+    async def _process_with_claude(
+        self, user_content, channel=None, processing_ts=None, client=None
+    ):
         """
         Process user message with Claude and return response.
 
+        When channel, processing_ts and client are given, the placeholder
+        message is updated periodically with the partial response while
+        Claude is still streaming, instead of only once at the end.
+
         Args:
             user_content (str): User's message content
+            channel (str): Channel ID of the placeholder message (optional)
+            processing_ts (str): Timestamp of the placeholder message (optional)
+            client: Slack Web API client (optional)
 
         Returns:
             str: Formatted response text
         """
+        from claude_code_sdk import query, AssistantMessage
+
+        if len(user_content) > self._MAX_PROMPT_CHARS:
+            self.logger.warning(
+                "Prompt truncated from %d to %d characters",
+                len(user_content),
+                self._MAX_PROMPT_CHARS,
+            )
+            user_content = user_content[: self._MAX_PROMPT_CHARS]
+
         try:
             responses = []
-            self.logger.info(f"Processing message: {user_content}")
-
-            # Query Claude Code SDK - Note: this is async but we're in sync context
-            # We need to handle this properly
-            import asyncio
-
-            async def get_claude_response():
-                responses = []
-                async for response in query(
-                    prompt=user_content, options=self.claude_options
-                ):
-                    self.logger.info(f"Received response type: {type(response)}")
-                    if isinstance(response, AssistantMessage):
-                        for block in response.content:
-                            if isinstance(block, TextBlock):
-                                responses.append(block.text)
-                            elif (
-                                isinstance(block, ToolUseBlock) and self.output_tool_use
-                            ):
-                                if block.name == "Bash":
-                                    responses.append(f"*{block.name}*")
-                                    responses.append(
-                                        f"```\n$ {block.input['command']} # {block.input.get('description')}\n```"
-                                    )
-                                else:
-                                    responses.append(f"*{block.name}*")
-                                    responses.append(
-                                        f"```\n{json.dumps(block.input, indent=2, ensure_ascii=False)}\n```"
-                                    )
-                return responses
-
-            # Run async function in current thread
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            responses = loop.run_until_complete(get_claude_response())
-
-            # Format response
+            # Running length of the joined response; lets us bail out of
+            # the stream as soon as the response is too long to display.
+            # The append helpers count one separator per fragment while
+            # "\n".join emits one fewer, so start at -1 to compensate.
+            total_len = -1
+            last_update = time.monotonic()
+            self.logger.info("Processing message: %s", user_content)
+
+            # Query Claude Code SDK directly on the running event loop
+            async for response in query(
+                prompt=user_content, options=self.claude_options
+            ):
+                self.logger.info("Received response type: %s", type(response))
+                if isinstance(response, AssistantMessage):
+                    # Dispatch on the exact block type; unknown block types
+                    # (and tool-use blocks when disabled) are skipped
+                    for block in response.content:
+                        append_block = self._block_dispatch.get(type(block))
+                        if append_block:
+                            total_len += append_block(block, responses)
+                    if total_len > 4000:
+                        self.logger.info(
+                            "Response exceeded display limit, stopping stream early"
+                        )
+                        return self._msg_long
+
+                    # Debounced partial update so the user sees progress
+                    # instead of "Processing..." for the whole response
+                    if (
+                        client is not None
+                        and responses
+                        and time.monotonic() - last_update
+                        >= self._STREAM_UPDATE_INTERVAL
+                    ):
+                        partial_text = "\n".join(responses)
+                        try:
+                            await client.chat_update(
+                                channel=channel,
+                                ts=processing_ts,
+                                text=partial_text,
+                            )
+                        except Exception as update_error:
+                            self.logger.warning(
+                                "Partial update failed: %s", update_error
+                            )
+                        last_update = time.monotonic()
+
+            # Format response (fragments are already in Slack mrkdwn)
             response_text = "\n".join(responses) if responses else ""
 
-            # Convert to Slack format
-            if response_text:
-                response_text = self._convert_to_slack_format(response_text)
-
             if response_text and len(response_text) > 4000:
-                return self.config["messages"]["long_response_error"]
+                return self._msg_long
             elif len(response_text) == 0:
-                return self.config["messages"]["empty_response"]
+                return self._msg_empty_resp
             else:
                 return response_text
 
-        except Exception as e:
-            self.logger.error(f"Error processing with Claude: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
-            return self.config["messages"]["general_error"]
+        except Exception:
+            self.logger.exception("Error processing with Claude")
+            return self._msg_error
 
     def start(self):
         """
         Start the Slack bot.
         """
+        import asyncio
+
         self.logger.info("Starting Slack bot with Socket Mode...")
-        self.handler.start()
+        asyncio.run(self._start_async())
+
+    async def _start_async(self):
+        """
+        Attach a persistent HTTP session to the Web API client and run the
+        Socket Mode handler until it exits.
+
+        Without a supplied session, AsyncWebClient opens and closes an
+        aiohttp.ClientSession per request; one long-lived session keeps
+        HTTP keep-alive (and the TLS handshake) amortized across updates.
+        """
+        import aiohttp
+
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.web.timeout)
+        ) as session:
+            self.web.session = session
+            await self.handler.start_async()
 
 
 def setup_logging(log_level):
@@ -292,56 +520,126 @@ def setup_logging(log_level):
         log_level (str): Logging level
     """
     logging.basicConfig(
-        level=getattr(logging, log_level),
+        level=logging.getLevelNamesMapping()[log_level],
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        force=True,
     )
 
     # Set Slack SDK logging to INFO to reduce noise
     logging.getLogger("slack_bolt").setLevel(logging.INFO)
 
 
+@lru_cache(maxsize=1)
 def load_config():
     """
     Load configuration from YAML file.
 
+    The result is memoized: repeat callers in the same process (tests,
+    embedders) get the parsed dict without touching the filesystem.
+    Use load_config.cache_clear() to force a reload.
+
     Returns:
         dict: Configuration dictionary or None if loading fails
     """
-    config_path = os.path.join(os.path.dirname(__file__), "config.yaml")
+    import yaml
+
+    try:
+        # Use the libyaml-backed C loader when available (much faster parsing)
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
     logger = logging.getLogger(__name__)
 
+    # Reuse the JSON cache when it is at least as new as the YAML file.
+    # JSON parsing is much faster than YAML, so repeated startups skip
+    # the expensive parse entirely.
     try:
-        with open(config_path, "r", encoding="utf-8") as file:
-            config = yaml.safe_load(file)
+        if os.path.getmtime(CONFIG_CACHE_PATH) >= os.path.getmtime(CONFIG_PATH):
+            with open(CONFIG_CACHE_PATH, "r", encoding="utf-8") as file:
+                return json.load(file)
+    except (OSError, ValueError):
+        pass  # Missing, stale or corrupt cache - fall back to parsing YAML
+
+    try:
+        with open(CONFIG_PATH, "r", encoding="utf-8") as file:
+            config = yaml.load(file, Loader=SafeLoader)
+        # Write the cache atomically; failures here must never break
+        # startup (TypeError covers YAML values such as dates that have
+        # no JSON representation)
+        try:
+            with open(CONFIG_CACHE_PATH + ".tmp", "w", encoding="utf-8") as file:
+                json.dump(config, file)
+            os.replace(CONFIG_CACHE_PATH + ".tmp", CONFIG_CACHE_PATH)
+        except (OSError, TypeError, ValueError):
+            pass
         return config
     except FileNotFoundError:
-        logger.error(f"Configuration file not found: {config_path}")
+        logger.error("Configuration file not found: %s", CONFIG_PATH)
         logger.error("Please create config.yaml based on config.example.yaml")
         return None
     except yaml.YAMLError as e:
-        logger.error(f"Failed to load YAML configuration file: {e}")
+        logger.error("Failed to load YAML configuration file: %s", e)
         return None
 
 
-def main():
+_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+def _parse_log_level(argv):
     """
-    Main entry point for the Slack bot application.
+    Parse the --log-level option without importing argparse.
+
+    A manual scan covers the normal server launch (no flags, or a single
+    --log-level); argparse and its transitive imports are only loaded for
+    --help or anything unrecognized.
+
+    Args:
+        argv (list): Command line arguments without the program name
+
+    Returns:
+        str: Selected logging level
     """
-    # Parse command line arguments
+    log_level = "INFO"
+    i = 0
+    recognized = True
+    while i < len(argv):
+        if argv[i] == "--log-level" and i + 1 < len(argv):
+            log_level = argv[i + 1]
+            i += 2
+        elif argv[i].startswith("--log-level="):
+            log_level = argv[i].split("=", 1)[1]
+            i += 1
+        else:
+            recognized = False
+            break
+
+    if recognized and log_level in _LOG_LEVELS:
+        return log_level
+
+    # --help, unknown flags or an invalid level: let argparse report it
+    import argparse
+
     parser = argparse.ArgumentParser(description="Claude Code Slack Agent")
     parser.add_argument(
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=_LOG_LEVELS,
         default="INFO",
         help="Set the logging level (default: INFO)",
     )
-    args = parser.parse_args()
+    return parser.parse_args(argv).log_level
+
+
+def main():
+    """
+    Main entry point for the Slack bot application.
+    """
+    # Parse command line arguments
+    log_level = _parse_log_level(sys.argv[1:])
 
     # Set up logging
-    setup_logging(args.log_level)
+    setup_logging(log_level)
     logger = logging.getLogger(__name__)
-    logger.info(f"Starting application with log level: {args.log_level}")
+    logger.info("Starting application with log level: %s", log_level)
 
     # Load configuration
     config = load_config()
@@ -363,7 +661,7 @@ def main():
     for token_name in required_tokens:
         token_value = slack_config.get(token_name)
         if not token_value or token_value.startswith("your_slack_"):
-            logger.error(f"Slack {token_name} is not configured in config.yaml")
+            logger.error("Slack %s is not configured in config.yaml", token_name)
             return
 
     logger.info("Tokens validated successfully")
@@ -375,9 +673,8 @@ def main():
         bot.start()
     except KeyboardInterrupt:
         logger.info("Stopping bot...")
-    except Exception as e:
-        logger.error(f"Error occurred while running bot: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+    except Exception:
+        logger.exception("Error occurred while running bot")
         raise
 
 
@@ -3,6 +3,8 @@ import sys
 import os
 from unittest.mock import patch, mock_open
 
+import pytest
+
 # Add the parent directory to the Python path to import main module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -10,6 +12,14 @@ import main  # noqa: E402
 from main import load_config, setup_logging  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Reset the load_config memoization between tests."""
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
 def test_load_config_success():
     """Test successful configuration loading."""
     mock_config = {
@@ -47,6 +57,65 @@ def test_load_config_yaml_error():
         assert config is None
 
 
+@pytest.fixture
+def config_paths(tmp_path, monkeypatch):
+    """Point load_config at a config file and cache inside tmp_path."""
+    config_path = tmp_path / "config.yaml"
+    cache_path = tmp_path / "config.yaml.cache.json"
+    monkeypatch.setattr(main, "CONFIG_PATH", str(config_path))
+    monkeypatch.setattr(main, "CONFIG_CACHE_PATH", str(cache_path))
+    return config_path, cache_path
+
+
+def test_load_config_writes_and_uses_cache(config_paths):
+    """Test that a fresh JSON cache is written and used on the next load."""
+    config_path, cache_path = config_paths
+    config_path.write_text(yaml.dump({"slack": {"bot_token": "from_yaml"}}))
+
+    config = load_config()
+    assert config["slack"]["bot_token"] == "from_yaml"
+    assert cache_path.exists()
+
+    # A cache newer than the YAML is served without reparsing
+    cache_path.write_text('{"slack": {"bot_token": "from_cache"}}')
+    os.utime(str(cache_path), (os.path.getmtime(str(config_path)) + 10,) * 2)
+    load_config.cache_clear()
+    config = load_config()
+    assert config["slack"]["bot_token"] == "from_cache"
+
+
+def test_load_config_stale_cache_reparses_yaml(config_paths):
+    """Test that a cache older than the YAML file is ignored."""
+    config_path, cache_path = config_paths
+    cache_path.write_text('{"slack": {"bot_token": "stale"}}')
+    config_path.write_text(yaml.dump({"slack": {"bot_token": "fresh"}}))
+    os.utime(str(cache_path), (os.path.getmtime(str(config_path)) - 10,) * 2)
+
+    config = load_config()
+    assert config["slack"]["bot_token"] == "fresh"
+
+
+def test_load_config_corrupt_cache_falls_back(config_paths):
+    """Test that an unreadable cache falls back to parsing the YAML."""
+    config_path, cache_path = config_paths
+    config_path.write_text(yaml.dump({"slack": {"bot_token": "from_yaml"}}))
+    cache_path.write_text("not json{")
+    os.utime(str(cache_path), (os.path.getmtime(str(config_path)) + 10,) * 2)
+
+    config = load_config()
+    assert config["slack"]["bot_token"] == "from_yaml"
+
+
+def test_load_config_unserializable_value_still_loads(config_paths):
+    """Test that YAML values without a JSON form don't break loading."""
+    config_path, cache_path = config_paths
+    config_path.write_text("slack:\n  bot_token: token\nlaunch_date: 2024-01-01\n")
+
+    config = load_config()
+    assert config["slack"]["bot_token"] == "token"
+    assert not cache_path.exists()
+
+
 def test_setup_logging():
     """Test logging setup."""
     with patch("logging.basicConfig") as mock_basic_config: